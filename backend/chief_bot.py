@@ -5,15 +5,40 @@ Voice interface using Pipecat, Daily.co, Deepgram, OpenAI (built-in LLM)
 ChiefVoice Gateway integration via event handlers (not in pipeline)
 """
 import asyncio
+import math
 import os
+import re
 import sys
 import json
 import random
 import time
+from collections import deque
 import websockets
 from dotenv import load_dotenv
 from loguru import logger
 
+# Optional: google-re2 matches the phrase regexes below in linear time (DFA)
+try:
+    import re2 as phrase_re
+except Exception:
+    phrase_re = re  # type: ignore
+
+# Optional: orjson parses/serializes gateway frames several times faster than json
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        # Decode so websockets still sends a text frame
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Immediate acknowledgment phrases (said after ~2s if no response yet)
 # These should sound like a real person acknowledging they heard you
 IMMEDIATE_PHRASES = [
@@ -57,6 +82,16 @@ EXTENDED_FILLER_PHRASES = [
     "Yeah, sorry about the wait. Working on it.",
 ]
 
+def phrase_cycle(phrase_list: list):
+    """Endlessly yield phrases in shuffled rounds — no repeats within a round or across its boundary."""
+    last = None
+    while True:
+        order = random.sample(phrase_list, len(phrase_list))
+        if order[0] == last:
+            order[0], order[-1] = order[-1], order[0]
+        yield from order
+        last = order[-1]
+
 # Context-aware filler keywords — if user message contains these, use specific fillers
 CONTEXT_FILLERS = {
     "email": ["Checking your inbox now.", "Going through your emails.", "Let me pull up your mail."],
@@ -69,37 +104,61 @@ CONTEXT_FILLERS = {
     "github": ["Checking GitHub now.", "Looking at the repo.", "Pulling up GitHub."],
 }
 
+# Trailing whitespace and punctuation, trimmed in one pass (handles mixes like "bye !")
+_TRAILING_STRIP_CHARS = " \t\r\n!?.,:;"
+
+def normalize_message(message: str) -> tuple:
+    """
+    Lowercase a user message once for all the predicates below.
+    Returns (normalized, words): the text trimmed of whitespace and trailing punctuation
+    (for is_farewell/is_simple_chat), and its set of lowercase words (for is_echo).
+    """
+    lower = message.lower()
+    return lower.lstrip().rstrip(_TRAILING_STRIP_CHARS), frozenset(lower.split())
+
 # Farewell patterns that should end the call
-FAREWELL_PATTERNS = {
+FAREWELL_PATTERNS = frozenset({
     "bye", "goodbye", "see you", "later", "take care", "night", "good night",
     "gotta go", "talk to you later", "catch you later", "i'm done", "end call",
     "hang up", "disconnect", "that's all", "thanks bye", "thank you bye",
-}
+})
+
+# Keywords that end the call wherever they appear in the message
+FAREWELL_KEYWORDS = frozenset({"bye", "goodbye", "goodnight", "later", "disconnect", "hang up", "end call"})
+
+def _phrase_alternation(phrases) -> str:
+    """Build a regex alternation, longest phrase first so multi-word phrases win."""
+    return "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
 
-def is_farewell(message: str) -> bool:
+
+# Compiled once at import — a single scan finds farewell phrases at the start or end of the
+# message (whole words only, so "tonight" isn't "night")
+_FAREWELL_RE = phrase_re.compile(r"\b(?:" + _phrase_alternation(FAREWELL_PATTERNS) + r")\b")
+
+def is_farewell(message: str, normalized: str = None) -> bool:
     """Check if a message is a farewell that should end the call."""
-    msg = message.lower().strip().rstrip("!?.,:;")
+    msg = normalized if normalized is not None else normalize_message(message)[0]
 
     # Exact match
     if msg in FAREWELL_PATTERNS:
         return True
 
     # Starts or ends with farewell
-    for pattern in FAREWELL_PATTERNS:
-        if msg.startswith(pattern) or msg.endswith(pattern):
+    for match in _FAREWELL_RE.finditer(msg):
+        if match.start() == 0 or match.end() == len(msg):
             return True
 
-    # Contains farewell keywords (for phrases like "okay goodbye" or "goodbye rosie")
-    farewell_keywords = {"bye", "goodbye", "goodnight", "later", "disconnect", "hang up", "end call"}
-    words = set(msg.split())
-    if words & farewell_keywords:  # Intersection - any match
+    # Contains farewell keywords (for phrases like "okay goodbye" or "goodbye rosie").
+    # Whitespace-separated words only: "later," mid-sentence ("remind me later, please")
+    # isn't a goodbye, and "hang up"/"end call" never match here ("don't hang up yet")
+    if not FAREWELL_KEYWORDS.isdisjoint(msg.split()):
         logger.info(f"🔍 Farewell keyword found in: '{msg}'")
         return True
 
     return False
 
 # Simple chat patterns that don't need acknowledgment phrases
-SIMPLE_CHAT_PATTERNS = {
+SIMPLE_CHAT_PATTERNS = frozenset({
     # Greetings
     "hi", "hello", "hey", "howdy", "hiya", "yo",
     "good morning", "good afternoon", "good evening", "good night",
@@ -112,70 +171,171 @@ SIMPLE_CHAT_PATTERNS = {
     "right", "correct", "got it", "understood", "alright", "fine",
     # Acknowledgments
     "cool", "nice", "great", "awesome", "perfect", "sounds good",
-}
+})
+
+# Simple pattern followed by more words (e.g., "hello there", "thanks, chief")
+_SIMPLE_CHAT_PREFIX_RE = phrase_re.compile(r"^(?:" + _phrase_alternation(SIMPLE_CHAT_PATTERNS) + r")[ ,]")
 
-def is_simple_chat(message: str) -> bool:
+# Words that turn a short message into a request rather than simple chat
+QUESTION_WORDS = frozenset({"what", "where", "when", "who", "why", "how", "which", "check", "find", "get", "show", "tell"})
+
+def is_simple_chat(message: str, normalized: str = None) -> bool:
     """Check if a message is simple conversational chat that doesn't need Gateway lookup."""
-    msg = message.lower().strip().rstrip("!?.,:;")
+    msg = normalized if normalized is not None else normalize_message(message)[0]
 
     # Check exact matches
     if msg in SIMPLE_CHAT_PATTERNS:
         return True
 
     # Check if message starts with a simple pattern (e.g., "hello there")
-    for pattern in SIMPLE_CHAT_PATTERNS:
-        if msg.startswith(pattern + " ") or msg.startswith(pattern + ","):
-            # But not if it's a question (e.g., "hey can you check...")
-            if " can " in msg or " could " in msg or " would " in msg or "?" in message:
-                return False
-            return True
+    if _SIMPLE_CHAT_PREFIX_RE.match(msg):
+        # But not if it's a question (e.g., "hey can you check...")
+        if " can " in msg or " could " in msg or " would " in msg or "?" in message:
+            return False
+        return True
 
     # Very short messages (1-2 words) without question words are likely simple chat
     words = msg.split()
     if len(words) <= 2:
-        question_words = {"what", "where", "when", "who", "why", "how", "which", "check", "find", "get", "show", "tell"}
-        if not any(w in question_words for w in words) and "?" not in message:
+        if QUESTION_WORDS.isdisjoint(words) and "?" not in message:
             return True
 
     return False
 
-def is_echo(user_message: str, recent_bot_responses: list, threshold: float = 0.6) -> bool:
+# Filler words ignored when comparing user speech with bot speech
+ECHO_FILLER_WORDS = frozenset({"the", "a", "an", "is", "are", "was", "were", "to", "and", "or", "i", "you", "it"})
+
+def echo_words(text: str) -> frozenset:
+    """Meaningful (non-filler) words of a message, precomputed once per bot response."""
+    return frozenset(text.lower().split()) - ECHO_FILLER_WORDS
+
+def is_echo(user_message: str, recent_bot_responses: deque, threshold: float = 0.6,
+            user_words: frozenset = None) -> bool:
     """
     Check if the user message is likely an echo of the bot's own speech.
+    recent_bot_responses holds (text, echo_words(text)) tuples.
     Returns True if the message appears to be echo (should be ignored).
     """
     if not recent_bot_responses:
         return False
 
-    user_words = set(user_message.lower().split())
+    if user_words is None:
+        user_words = normalize_message(user_message)[1]
     if len(user_words) < 2:
         return False  # Too short to reliably detect echo
 
-    for bot_response in recent_bot_responses:
-        bot_words = set(bot_response.lower().split())
-        if not bot_words:
+    meaningful_user = user_words - ECHO_FILLER_WORDS
+    if not meaningful_user:
+        return False
+
+    # Minimum number of shared words, computed once instead of a ratio per response
+    # (epsilon keeps e.g. 0.3 * 10 == 3.0000000000000004 from rounding up to 4)
+    min_overlap = math.ceil(threshold * len(meaningful_user) - 1e-9)
+
+    for _, bot_words in recent_bot_responses:
+        # Too few words in the bot response to ever reach the threshold — skip the intersection
+        if len(bot_words) < min_overlap:
             continue
 
         # Check word overlap - if user message shares many words with bot response
-        common_words = user_words & bot_words
-        # Ignore common filler words
-        filler_words = {"the", "a", "an", "is", "are", "was", "were", "to", "and", "or", "i", "you", "it"}
-        meaningful_common = common_words - filler_words
-        meaningful_user = user_words - filler_words
-
-        if len(meaningful_user) > 0:
-            overlap_ratio = len(meaningful_common) / len(meaningful_user)
-            if overlap_ratio >= threshold:
-                logger.info(f"🔇 Echo detected! User: '{user_message[:50]}' overlaps {overlap_ratio:.0%} with bot response")
-                return True
+        overlap = len(meaningful_user & bot_words)
+        if overlap >= min_overlap:
+            overlap_ratio = overlap / len(meaningful_user)
+            logger.info(f"🔇 Echo detected! User: '{user_message[:50]}' overlaps {overlap_ratio:.0%} with bot response")
+            return True
 
     return False
 
+# Streamed text is flushed to TTS at these boundaries (precompiled — runs on every delta)
+_SENTENCE_END_RE = re.compile(r"[.!?\n][ \n]*")
+# Clause marks only count when followed by whitespace, so "10:30", "555-1234" and
+# "follow-up" stay whole (a mark at the end of the buffer waits for the next delta)
+_CLAUSE_END_RE = re.compile(r"[,;:—–-][ \n]+")
+FIRST_CLAUSE_MIN_CHARS = 15  # Earliest clause break for the first chunk
+FIRST_SENTENCE_MIN_CHARS = 20  # Earliest sentence break for the first chunk
+SENTENCE_MIN_CHARS = 50  # ...and for later chunks
+LONG_CHUNK_CHARS = 100  # Force a word break once the buffer passes this without punctuation
+MIN_WORD_BREAK_CHARS = 30  # ...but not if the last space before it is this early
+
+def split_tts_chunk(text_buffer: str, first_chunk: bool, clause_break: bool = True, scan_from: int = 0) -> tuple:
+    """
+    Split the next speakable chunk off the front of the streamed text buffer.
+    First chunk: send at the first clause break after ~15 chars (low-latency first audio).
+    Later chunks: send at sentence boundaries or ~100 chars.
+    scan_from skips text already searched without a match (pass len(text_buffer) - 1 from
+    before the latest delta was appended, or 0 after a split) so each delta is scanned once;
+    the last char is rescanned since a clause mark needs the whitespace that follows it.
+    Returns (send_text, remaining_buffer); send_text is "" until there's enough text.
+    """
+    # Check for sentence-ending punctuation (the match includes trailing whitespace)
+    sentence_min = FIRST_SENTENCE_MIN_CHARS if first_chunk else SENTENCE_MIN_CHARS
+    match = _SENTENCE_END_RE.search(text_buffer, max(sentence_min, scan_from))
+
+    # For first chunk, also break at the first comma/dash/colon so TTS starts speaking
+    # while the rest of the sentence is still streaming in
+    if not match and clause_break and first_chunk:
+        match = _CLAUSE_END_RE.search(text_buffer, max(FIRST_CLAUSE_MIN_CHARS, scan_from))
+
+    if match:
+        return text_buffer[:match.end()], text_buffer[match.end():]
+
+    # Also send if buffer is getting long (100+ chars without punctuation)
+    if len(text_buffer) > LONG_CHUNK_CHARS:
+        break_point = text_buffer.rfind(' ', 0, LONG_CHUNK_CHARS)
+        if break_point > MIN_WORD_BREAK_CHARS:
+            return text_buffer[:break_point + 1], text_buffer[break_point + 1:]
+
+    return "", text_buffer
+
+
+_STREAM_END = object()
+
+
+async def coalesce(chunks):
+    """
+    Re-yield an async stream of text chunks, joining the ones that arrived while the
+    consumer was busy so each loop iteration handles one string instead of many tiny deltas.
+    Never waits for more text: whatever is already buffered is yielded right away.
+    """
+    queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async for chunk in chunks:
+                queue.put_nowait(chunk)
+            queue.put_nowait(_STREAM_END)
+        except Exception as e:
+            queue.put_nowait(e)
+
+    pump_task = asyncio.create_task(pump())
+    pending = None
+    try:
+        while True:
+            item = await queue.get() if pending is None else pending
+            pending = None
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+
+            batch = [item]
+            while not queue.empty():
+                item = queue.get_nowait()
+                if not isinstance(item, str):
+                    pending = item  # End/error: yield what we have first
+                    break
+                batch.append(item)
+            yield batch[0] if len(batch) == 1 else "".join(batch)
+    finally:
+        pump_task.cancel()
+
 from pipecat.frames.frames import (
+    BotStoppedSpeakingFrame,
     EndFrame,
     LLMMessagesFrame,
     TTSSpeakFrame,
     StartInterruptionFrame,
+    UserStartedSpeakingFrame,
 )
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
@@ -252,6 +412,23 @@ OUTBOUND_REASON = os.getenv("OUTBOUND_REASON", "")
 OUTBOUND_URGENCY = os.getenv("OUTBOUND_URGENCY", "medium")
 OUTBOUND_CONTEXT = os.getenv("OUTBOUND_CONTEXT", "")
 
+# Acknowledgment/filler timing while waiting on the Gateway (seconds, resolved once at startup)
+ACK_DELAY_SECS = float(os.getenv("ACK_DELAY_SECS", "2.0"))
+FILLER_DELAY_SECS = float(os.getenv("FILLER_DELAY_SECS", "4.0"))
+EXTENDED_FILLER_DELAY_SECS = float(os.getenv("EXTENDED_FILLER_DELAY_SECS", "4.0"))  # After the first filler
+
+# Spoken-duration estimate for a queued reply: TTS startup plus words at ~200 wpm (tune per voice)
+TTS_STARTUP_SECS = float(os.getenv("TTS_STARTUP_SECS", "0.3"))
+TTS_WORDS_PER_SEC = float(os.getenv("TTS_WORDS_PER_SEC", "3.3"))
+
+
+def estimate_speech_remaining(text: str, started: float = None) -> float:
+    """Seconds of speech left for text whose first TTS frame was queued at started (time.monotonic())"""
+    total = max(0.8, TTS_STARTUP_SECS + (text.count(" ") + 1) / TTS_WORDS_PER_SEC)
+    if started is None:
+        return total
+    return max(0.0, total - (time.monotonic() - started))
+
 # Configure logging
 logger.remove(0)
 logger.add(sys.stderr, level="INFO")
@@ -266,71 +443,101 @@ class ChiefVoiceGatewayClient:
     def __init__(self, gateway_url: str, token: str, call_id: str = None):
         self.gateway_url = gateway_url
         self.token = token
-        self.call_id = call_id or f"pipecat-{int(asyncio.get_event_loop().time())}"
+        self.call_id = call_id or f"pipecat-{int(time.monotonic())}"
         self.session_key = f"agent:voice:chief-voice-{self.call_id}"
         self.ws = None
         self.connected = False
         self.request_counter = 0
         self._lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()  # One handshake at a time
+        self._preconnect_task = None
         logger.info(f"Gateway client initialized: {self.gateway_url}")
 
     async def connect(self):
-        """Connect to ChiefVoice Gateway using protocol v3"""
-        if self.connected and self.ws:
-            return
-
+        """Connect to ChiefVoice Gateway (no-op if already connected)"""
+        async with self._connect_lock:
+            if self.connected and self.ws:
+                return
+            await self._handshake()
+
+    async def _handshake(self):
+        """Open the WebSocket and authenticate using protocol v3"""
         logger.info(f"Connecting to ChiefVoice Gateway: {self.gateway_url}")
 
         try:
             self.ws = await websockets.connect(self.gateway_url)
 
-            # Wait for connect.challenge event
-            challenge_received = False
-            while not challenge_received:
-                message = await asyncio.wait_for(self.ws.recv(), timeout=10)
-                frame = json.loads(message)
-
-                if frame.get("type") == "event" and frame.get("event") == "connect.challenge":
-                    logger.info("Received connect.challenge, sending auth")
-                    challenge_received = True
-
-                    # Send connect request with auth
-                    connect_req = {
-                        "type": "req",
-                        "id": "connect-1",
-                        "method": "connect",
-                        "params": {
-                            "minProtocol": 3,
-                            "maxProtocol": 3,
-                            "client": {
-                                "id": "gateway-client",
-                                "version": "0.1.0",
-                                "platform": sys.platform,
-                                "mode": "backend",
-                            },
-                            "auth": {
-                                "token": self.token,
-                            },
-                        },
-                    }
-                    await self.ws.send(json.dumps(connect_req))
-
-                    # Wait for connect response
-                    response = await asyncio.wait_for(self.ws.recv(), timeout=10)
-                    res_frame = json.loads(response)
-
-                    if res_frame.get("type") == "res" and res_frame.get("id") == "connect-1":
-                        if res_frame.get("ok"):
-                            logger.info("✅ Successfully authenticated to ChiefVoice Gateway")
-                            self.connected = True
-                        else:
-                            error = res_frame.get("error", {})
-                            raise Exception(f"Authentication failed: {error.get('message', 'Unknown error')}")
+            # The gateway always opens with a connect.challenge event
+            message = await asyncio.wait_for(self.ws.recv(), timeout=10)
+            frame = _json_loads(message)
+            if frame.get("type") != "event" or frame.get("event") != "connect.challenge":
+                raise Exception(f"Expected connect.challenge, got {frame.get('type')}/{frame.get('event')}")
+
+            logger.info("Received connect.challenge, sending auth")
+
+            # Send connect request with auth
+            connect_req = {
+                "type": "req",
+                "id": "connect-1",
+                "method": "connect",
+                "params": {
+                    "minProtocol": 3,
+                    "maxProtocol": 3,
+                    "client": {
+                        "id": "gateway-client",
+                        "version": "0.1.0",
+                        "platform": sys.platform,
+                        "mode": "backend",
+                    },
+                    "auth": {
+                        "token": self.token,
+                    },
+                },
+            }
+            await self.ws.send(_json_dumps(connect_req))
+
+            # Wait for connect response
+            response = await asyncio.wait_for(self.ws.recv(), timeout=10)
+            res_frame = _json_loads(response)
+
+            if res_frame.get("type") != "res" or res_frame.get("id") != "connect-1":
+                raise Exception(f"Unexpected connect response: {res_frame.get('type')}/{res_frame.get('id')}")
+            if not res_frame.get("ok"):
+                error = res_frame.get("error", {})
+                raise Exception(f"Authentication failed: {error.get('message', 'Unknown error')}")
+
+            logger.info("✅ Successfully authenticated to ChiefVoice Gateway")
+            self.connected = True
 
         except Exception as e:
             logger.error(f"Failed to connect to gateway: {e}")
+            # Don't leave a half-open socket behind a failed handshake
+            if self.ws:
+                try:
+                    await self.ws.close()
+                except Exception:
+                    pass
+                self.ws = None
             raise
 
+    def preconnect(self):
+        """
+        Start a background connect ahead of the next request.
+        Returns the task, or None if already connected or a handshake is under way.
+        """
+        if self.connected or self._connect_lock.locked():
+            return None
+        if self._preconnect_task and not self._preconnect_task.done():
+            return None
+        self._preconnect_task = asyncio.create_task(self._preconnect())
+        return self._preconnect_task
+
+    async def _preconnect(self):
+        try:
+            await self.connect()
+        except Exception:
+            pass  # Already logged; stream_message reports it if still disconnected
+
     async def send_message(self, message: str) -> str:
         """Send a message to ChiefVoice Gateway and get full response (non-streaming)"""
         full_text = ""
@@ -341,12 +548,19 @@ class ChiefVoiceGatewayClient:
     async def stream_message(self, message: str):
         """Stream a message to ChiefVoice Gateway and yield text chunks as they arrive"""
         if not self.connected:
-            await self.connect()
+            if self._preconnect_task and not self._preconnect_task.done():
+                # Join the background handshake instead of queueing a second one behind it
+                await self._preconnect_task
+                if not self.connected:
+                    raise Exception("Gateway unreachable (background connect failed)")
+            else:
+                await self.connect()
 
         async with self._lock:
             self.request_counter += 1
             request_id = f"chat-{self.request_counter}"
-            idempotency_key = f"voice-{int(asyncio.get_event_loop().time())}-{self.request_counter}"
+            # Nanosecond clock: unique per request without a loop lookup or float rounding
+            idempotency_key = f"voice-{time.monotonic_ns()}-{self.request_counter}"
 
             # Send chat.send request
             # Agent is selected via session key prefix: "agent:voice:..."
@@ -363,8 +577,8 @@ class ChiefVoiceGatewayClient:
                 },
             }
 
-            logger.info(f"Sending to Gateway: {message}")
-            await self.ws.send(json.dumps(chat_req))
+            logger.info("Sending to Gateway: {}", message)
+            await self.ws.send(_json_dumps(chat_req))
 
             # Wait for response and stream events (inside lock to prevent concurrent recv)
             run_id = None
@@ -372,48 +586,46 @@ class ChiefVoiceGatewayClient:
             try:
                 while True:
                     msg = await asyncio.wait_for(self.ws.recv(), timeout=120)
-                    frame = json.loads(msg)
-
-                    frame_type = frame.get("type")
-                    frame_event = frame.get("event")
-
-                    # Handle chat.send response (contains runId)
-                    if frame_type == "res" and frame.get("id") == request_id:
-                        if frame.get("ok"):
+                    frame = _json_loads(msg)
+
+                    # Dispatch on (type, event) once per frame
+                    match frame.get("type"), frame.get("event"):
+                        # Handle chat.send response (contains runId)
+                        case "res", _ if frame.get("id") == request_id:
+                            if frame.get("ok"):
+                                payload = frame.get("payload", {})
+                                run_id = payload.get("runId")
+                            else:
+                                error = frame.get("error", {})
+                                raise Exception(f"Chat request failed: {error.get('message', 'Unknown error')}")
+
+                        # Handle agent events (streaming response)
+                        case "event", "agent":
                             payload = frame.get("payload", {})
-                            run_id = payload.get("runId")
-                        else:
-                            error = frame.get("error", {})
-                            raise Exception(f"Chat request failed: {error.get('message', 'Unknown error')}")
-
-                    # Handle agent events (streaming response)
-                    if frame_type == "event" and frame_event == "agent":
-                        payload = frame.get("payload", {})
 
-                        if run_id and payload.get("runId") == run_id:
-                            stream_type = payload.get("stream")
-                            data = payload.get("data", {})
+                            if run_id and payload.get("runId") == run_id:
+                                stream_type = payload.get("stream")
+                                data = payload.get("data", {})
 
-                            # Stream assistant text - yield each chunk immediately
-                            if stream_type == "assistant" and "delta" in data:
-                                yield data["delta"]
+                                # Stream assistant text - yield each chunk immediately
+                                if stream_type == "assistant" and "delta" in data:
+                                    yield data["delta"]
+                                elif stream_type == "lifecycle" and data.get("phase") == "end":
+                                    logger.debug("Agent lifecycle ended, waiting for chat response...")
 
-                            if stream_type == "lifecycle" and data.get("phase") == "end":
-                                logger.info("Agent lifecycle ended, waiting for chat response...")
-
-                    # Handle chat events (for errors or fallback completion)
-                    if frame_type == "event" and frame_event == "chat":
-                        payload = frame.get("payload", {})
+                        # Handle chat events (for errors or fallback completion)
+                        case "event", "chat":
+                            payload = frame.get("payload", {})
 
-                        if run_id and payload.get("runId") == run_id:
-                            state = payload.get("state")
+                            if run_id and payload.get("runId") == run_id:
+                                state = payload.get("state")
 
-                            if state == "final":
-                                logger.info("Gateway response complete (final)")
-                                return
-                            elif state in ["aborted", "error"]:
-                                error_msg = payload.get("errorMessage", "Request failed")
-                                raise Exception(f"Chat failed: {error_msg}")
+                                if state == "final":
+                                    logger.info("Gateway response complete (final)")
+                                    return
+                                elif state in ["aborted", "error"]:
+                                    error_msg = payload.get("errorMessage", "Request failed")
+                                    raise Exception(f"Chat failed: {error_msg}")
 
             except asyncio.TimeoutError:
                 logger.error("Timeout waiting for gateway response")
@@ -428,6 +640,28 @@ class ChiefVoiceGatewayClient:
             logger.info("Gateway connection closed")
 
 
+# Shared HTTP session for transcript posts (created lazily inside the running loop)
+_transcript_session = None
+
+
+async def _get_transcript_session():
+    """Return the shared transcript session, creating it on first use."""
+    global _transcript_session
+    if _transcript_session is None or _transcript_session.closed:
+        import aiohttp
+        # Small keep-alive pool: one connection is reused for every post in the call
+        _transcript_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=4))
+    return _transcript_session
+
+
+async def close_transcript_session():
+    """Close the shared transcript session (call on shutdown)"""
+    global _transcript_session
+    if _transcript_session is not None:
+        await _transcript_session.close()
+        _transcript_session = None
+
+
 async def post_transcript(call_id: str, role: str, text: str):
     """Post transcript to the Chief API (no-op if CHIEF_API_URL not configured)"""
     api_url = os.getenv("CHIEF_API_URL", "")
@@ -435,22 +669,54 @@ async def post_transcript(call_id: str, role: str, text: str):
         return  # Skip if no API URL configured
     try:
         import aiohttp
-        async with aiohttp.ClientSession() as session:
-            await session.post(
-                f"{api_url}/api/pipecat/transcripts/{call_id}",
-                json={
-                    "role": role,
-                    "text": text,
-                    "timestamp": int(asyncio.get_event_loop().time() * 1000),
-                    "isFinal": True,
-                },
-                timeout=aiohttp.ClientTimeout(total=2),
-            )
-            logger.debug(f"Posted transcript: [{role}] {text[:50]}")
+        session = await _get_transcript_session()
+        async with session.post(
+            f"{api_url}/api/pipecat/transcripts/{call_id}",
+            json={
+                "role": role,
+                "text": text,
+                "timestamp": time.monotonic_ns() // 1_000_000,
+                "isFinal": True,
+            },
+            timeout=aiohttp.ClientTimeout(total=2),
+        ):
+            # Releasing the response returns the connection to the pool
+            pass
+        logger.debug(f"Posted transcript: [{role}] {text[:50]}")
     except Exception as e:
         logger.debug(f"Transcript post skipped: {e}")
 
 
+# Transcripts waiting to be posted by _transcript_worker (call_id, role, text)
+_transcript_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+
+
+def queue_transcript(call_id: str, role: str, text: str):
+    """Queue a transcript post without blocking the caller (dropped if the queue is full)"""
+    try:
+        _transcript_queue.put_nowait((call_id, role, text))
+    except asyncio.QueueFull:
+        logger.warning(f"Transcript queue full, dropping [{role}] {text[:50]}")
+
+
+async def _transcript_worker():
+    """Post queued transcripts in order, off the voice latency path"""
+    while True:
+        call_id, role, text = await _transcript_queue.get()
+        try:
+            await post_transcript(call_id, role, text)
+        finally:
+            _transcript_queue.task_done()
+
+
+async def drain_transcripts(timeout: float = 3.0):
+    """Give queued transcripts a bounded chance to post before shutdown"""
+    try:
+        await asyncio.wait_for(_transcript_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropping {_transcript_queue.qsize()} unposted transcript(s) at shutdown")
+
+
 async def main():
     """Main entry point for Chief Pipecat Bot - PHASE 1 REWRITE"""
     logger.info("🎤 Starting Chief Pipecat Bot (Phase 1)...")
@@ -556,6 +822,7 @@ async def main():
             call_id=call_id
         )
         logger.info("✅ Gateway client configured (will intercept messages)")
+    gateway_warm = asyncio.Event()  # Set once the gateway pre-connect attempt has finished
 
     # Load TOOLS.md for integration context
     tools_context = ""
@@ -647,19 +914,28 @@ When David asks you to do something — check email, look at calendar, update CR
         # Store original push_frame method
         original_push = user_aggregator.push_frame
         
-        # Track recently used phrases to avoid repetition
-        recent_immediate = []
-        recent_fillers = []
-        recent_bot_responses = []  # Track bot responses for echo detection
+        # Shuffled phrase rotations so fillers don't repeat back to back
+        immediate_phrases = phrase_cycle(IMMEDIATE_PHRASES)
+        filler_phrases = phrase_cycle(FILLER_PHRASES)
+        recent_bot_responses = deque(maxlen=3)  # (text, echo_words) of the last 3 bot responses for echo detection
         last_bot_speech_end = 0.0  # Timestamp when bot last finished speaking
         bot_is_speaking = False  # Flag to track if bot is currently speaking
         last_processed_message = ""  # Deduplication: track last message to avoid processing twice
-        processing_in_progress = False  # Prevent concurrent processing
+        gateway_in_flight = asyncio.Lock()  # Held while a message is being handled (one at a time)
+        bot_stopped_speaking = asyncio.Event()  # Set by the output transport's BotStoppedSpeakingFrame
 
         async def intercept_and_forward(frame, direction=None):
             """Intercept LLMMessagesFrame and forward to Gateway with streaming TTS"""
-            nonlocal recent_immediate, recent_fillers, recent_bot_responses, last_bot_speech_end, bot_is_speaking
-            nonlocal last_processed_message, processing_in_progress
+            nonlocal recent_bot_responses, last_bot_speech_end, bot_is_speaking
+            nonlocal last_processed_message
+
+            # Upstream from the output transport: the queued speech has finished playing
+            if isinstance(frame, BotStoppedSpeakingFrame):
+                bot_stopped_speaking.set()
+
+            # Re-establish a dropped gateway connection while the user is still talking
+            if isinstance(frame, UserStartedSpeakingFrame) and not gateway_client.connected:
+                gateway_client.preconnect()
 
             if isinstance(frame, LLMMessagesFrame):
                 messages = frame.messages
@@ -668,28 +944,31 @@ When David asks you to do something — check email, look at calendar, update CR
 
                     # Deduplication: Skip if same message as last processed
                     if user_message == last_processed_message:
-                        logger.info(f"🔇 Ignoring duplicate message: '{user_message[:50]}...'")
+                        logger.info("🔇 Ignoring duplicate message: '{:.50}...'", user_message)
                         return
 
                     # If still processing, interrupt TTS but don't start new gateway request
                     # (WebSocket lock prevents concurrent streams)
-                    if processing_in_progress:
-                        logger.info(f"🎤 Barge-in while processing: '{user_message[:50]}...'")
+                    if gateway_in_flight.locked():
+                        logger.info("🎤 Barge-in while processing: '{:.50}...'", user_message)
                         try:
                             await task.queue_frame(StartInterruptionFrame())
                         except Exception:
                             pass
                         return
 
+                    # Normalize once for the echo/simple-chat/farewell checks below
+                    msg_normalized, msg_words = normalize_message(user_message)
+
                     # During bot speech, only process if it's clearly NOT echo
                     # (Allow barge-in with different content, block echo of bot's words)
                     if bot_is_speaking:
                         # Check if this looks like echo
-                        if is_echo(user_message, recent_bot_responses, threshold=0.3):
-                            logger.info(f"🔇 Ignoring echo while bot speaking: '{user_message[:50]}...'")
+                        if is_echo(user_message, recent_bot_responses, threshold=0.3, user_words=msg_words):
+                            logger.info("🔇 Ignoring echo while bot speaking: '{:.50}...'", user_message)
                             return
                         else:
-                            logger.info(f"🎤 Barge-in detected (different content): '{user_message[:50]}...'")
+                            logger.info("🎤 Barge-in detected (different content): '{:.50}...'", user_message)
                             # Cancel current bot speech by setting flag
                             bot_is_speaking = False
 
@@ -698,29 +977,28 @@ When David asks you to do something — check email, look at calendar, update CR
                     # Only apply when time_since_bot is positive (bot has actually finished)
                     time_since_bot = time.time() - last_bot_speech_end
                     if 0 <= time_since_bot < 0.3:
-                        logger.info(f"🔇 Ignoring message during cooldown: '{user_message[:50]}' ({time_since_bot:.1f}s after bot)")
+                        logger.info("🔇 Ignoring message during cooldown: '{:.50}' ({:.1f}s after bot)", user_message, time_since_bot)
                         return  # Skip - likely echo
 
                     # Check for echo (bot hearing itself)
-                    if is_echo(user_message, recent_bot_responses, threshold=0.4):
-                        logger.info(f"🔇 Ignoring echo: '{user_message[:50]}...'")
+                    if is_echo(user_message, recent_bot_responses, threshold=0.4, user_words=msg_words):
+                        logger.info("🔇 Ignoring echo: '{:.50}...'", user_message)
                         return  # Skip processing - it's echo
 
-                    # Mark as processing
-                    processing_in_progress = True
+                    # Mark as processing (no await since the locked() check, so this can't race)
+                    await gateway_in_flight.acquire()
                     last_processed_message = user_message
-                    stt_complete_time = time.time()
-                    logger.info(f"🎤 User: {user_message}")
-                    logger.info(f"⏱️ [PERF] STT complete at {stt_complete_time:.3f}")
+                    stt_complete_ns = time.monotonic_ns()
+                    logger.info("🎤 User: {}", user_message)
+                    logger.info("⏱️ [PERF] STT complete at {:.3f}", time.time())
 
-                    # Post user transcript
-                    try:
-                        await post_transcript(call_id, "user", user_message)
-                    except Exception as e:
-                        logger.error(f"Failed to post user transcript: {e}")
+                    # Post user transcript (in the background)
+                    queue_transcript(call_id, "user", user_message)
 
                     # Check if this is simple chat (no acknowledgment needed)
-                    simple_chat = is_simple_chat(user_message)
+                    simple_chat = is_simple_chat(user_message, msg_normalized)
+                    # Decided up front so the post-response path goes straight to EndFrame
+                    farewell = is_farewell(user_message, msg_normalized)
 
                     # Filler/acknowledgment state
                     first_chunk_received = asyncio.Event()
@@ -728,18 +1006,6 @@ When David asks you to do something — check email, look at calendar, update CR
                     ack_task = None
                     filler_task = None
 
-                    def _pick_phrase(phrase_list, recent_list, max_recent=5):
-                        """Pick a phrase not recently used."""
-                        available = [p for p in phrase_list if p not in recent_list]
-                        if not available:
-                            recent_list.clear()
-                            available = phrase_list
-                        phrase = random.choice(available)
-                        recent_list.append(phrase)
-                        if len(recent_list) > max_recent:
-                            recent_list.pop(0)
-                        return phrase
-
                     def _get_context_filler(msg):
                         """Try to pick a context-aware filler based on the user's message."""
                         msg_lower = msg.lower()
@@ -749,15 +1015,15 @@ When David asks you to do something — check email, look at calendar, update CR
                         return None
 
                     async def send_acknowledgment_after_delay():
-                        """Send acknowledgment if response takes more than 2 seconds"""
-                        await asyncio.sleep(2)
+                        """Send acknowledgment if response takes more than ACK_DELAY_SECS"""
+                        await asyncio.sleep(ACK_DELAY_SECS)
                         if not first_chunk_received.is_set() and not acknowledgment_sent.is_set():
                             acknowledgment_sent.set()
                             # Try context-aware filler first
                             phrase = _get_context_filler(user_message)
                             if not phrase:
-                                phrase = _pick_phrase(IMMEDIATE_PHRASES, recent_immediate)
-                            logger.info(f"Acknowledgment: {phrase}")
+                                phrase = next(immediate_phrases)
+                            logger.info("Acknowledgment: {}", phrase)
                             await task.queue_frame(TTSSpeakFrame(text=phrase))
 
                     # Start acknowledgment timer for non-simple queries
@@ -768,19 +1034,18 @@ When David asks you to do something — check email, look at calendar, update CR
 
                     async def send_filler_after_delay():
                         """Send filler phrases at escalating intervals if response takes too long"""
-                        nonlocal recent_fillers
                         # First filler at ~4s
-                        await asyncio.sleep(4)
+                        await asyncio.sleep(FILLER_DELAY_SECS)
                         if not first_chunk_received.is_set():
-                            filler = _pick_phrase(FILLER_PHRASES, recent_fillers)
-                            logger.info(f"Filler: {filler}")
+                            filler = next(filler_phrases)
+                            logger.info("Filler: {}", filler)
                             await task.queue_frame(TTSSpeakFrame(text=filler))
 
                         # Extended filler at ~8s
-                        await asyncio.sleep(4)
+                        await asyncio.sleep(EXTENDED_FILLER_DELAY_SECS)
                         if not first_chunk_received.is_set():
                             extended = random.choice(EXTENDED_FILLER_PHRASES)
-                            logger.info(f"Extended filler: {extended}")
+                            logger.info("Extended filler: {}", extended)
                             await task.queue_frame(TTSSpeakFrame(text=extended))
 
                     try:
@@ -788,140 +1053,126 @@ When David asks you to do something — check email, look at calendar, update CR
                         if not simple_chat:
                             filler_task = asyncio.create_task(send_filler_after_delay())
 
+                        # The first turn can race the pre-connect; only give it a moment
+                        if not gateway_warm.is_set():
+                            try:
+                                await asyncio.wait_for(gateway_warm.wait(), timeout=0.05)
+                            except asyncio.TimeoutError:
+                                logger.warning("⚠️ Gateway not pre-warmed - connecting on first turn")
+
                         # Stream from Gateway and send chunks to TTS
-                        full_response = ""
+                        full_response_parts = []  # Joined once the stream ends
                         text_buffer = ""
+                        scan_from = 0  # text_buffer[:scan_from] holds no flush boundary
                         chunks_sent = 0
-                        gateway_send_time = time.time()
-                        first_chunk_time = None
-                        logger.info(f"⏱️ [PERF] Gateway request at {gateway_send_time:.3f} (STT→Gateway: {(gateway_send_time - stt_complete_time)*1000:.0f}ms)")
+                        first_tts_time = None  # time.monotonic() when the first reply chunk was queued
+                        pending_tts = []  # TTS enqueues in flight; they start in creation order
+                        # PERF "at" values are wall-clock (to match client/gateway logs); deltas use monotonic ns
+                        gateway_send_ns = time.monotonic_ns()
+                        logger.info(
+                            "⏱️ [PERF] Gateway request at {:.3f} (STT→Gateway: {:.0f}ms)",
+                            time.time(), (gateway_send_ns - stt_complete_ns) / 1e6,
+                        )
 
-                        async for chunk in gateway_client.stream_message(user_message):
-                            full_response += chunk
+                        async for chunk in coalesce(gateway_client.stream_message(user_message)):
+                            full_response_parts.append(chunk)
                             text_buffer += chunk
 
                             # Signal first chunk received (cancels filler)
                             if not first_chunk_received.is_set():
                                 first_chunk_received.set()
                                 bot_is_speaking = True  # Bot is now speaking
-                                first_chunk_time = time.time()
-                                ai_latency = first_chunk_time - gateway_send_time
-                                e2e_latency = first_chunk_time - stt_complete_time
+                                first_chunk_ns = time.monotonic_ns()
                                 logger.info("🚀 First chunk received - streaming to TTS")
-                                logger.info(f"⏱️ [PERF] First AI chunk at {first_chunk_time:.3f}")
-                                logger.info(f"⏱️ [PERF] 🎯 AI Response Time: {ai_latency:.2f}s | End-to-End: {e2e_latency:.2f}s")
+                                logger.info("⏱️ [PERF] First AI chunk at {:.3f}", time.time())
+                                logger.info(
+                                    "⏱️ [PERF] 🎯 AI Response Time: {:.2f}s | End-to-End: {:.2f}s",
+                                    (first_chunk_ns - gateway_send_ns) / 1e9, (first_chunk_ns - stt_complete_ns) / 1e9,
+                                )
 
                             # Send to TTS aggressively for low-latency first audio
-                            # First chunk: send at any natural break after ~30 chars
-                            # Later chunks: send at sentence boundaries or ~100 chars
-                            should_send = False
-                            send_text = ""
-
-                            min_chunk = 30 if chunks_sent == 0 else 60
-
-                            # Check for sentence-ending punctuation
-                            for i, char in enumerate(text_buffer):
-                                if char in '.!?\n' and i >= min_chunk - 10:
-                                    end_idx = i + 1
-                                    while end_idx < len(text_buffer) and text_buffer[end_idx] in ' \n':
-                                        end_idx += 1
-                                    send_text = text_buffer[:end_idx]
-                                    text_buffer = text_buffer[end_idx:]
-                                    should_send = True
+                            # (a coalesced batch can hold several boundaries; flush them all)
+                            while True:
+                                send_text, text_buffer = split_tts_chunk(
+                                    text_buffer, first_chunk=chunks_sent == 0, scan_from=scan_from
+                                )
+                                if not send_text:
+                                    scan_from = len(text_buffer) - 1
                                     break
+                                scan_from = 0
+
+                                if not send_text.isspace():
+                                    chunks_sent += 1
+                                    if chunks_sent == 1:
+                                        first_tts_time = time.monotonic()
+                                    logger.info("📢 TTS chunk {}: {:.50}...", chunks_sent, send_text)
+                                    pending_tts.append(asyncio.create_task(task.queue_frame(TTSSpeakFrame(text=send_text))))
 
-                            # For first chunk, also break at commas/dashes/colons for faster audio
-                            if not should_send and chunks_sent == 0 and len(text_buffer) > min_chunk:
-                                for i, char in enumerate(text_buffer):
-                                    if char in ',;:—–-' and i >= min_chunk:
-                                        end_idx = i + 1
-                                        while end_idx < len(text_buffer) and text_buffer[end_idx] == ' ':
-                                            end_idx += 1
-                                        send_text = text_buffer[:end_idx]
-                                        text_buffer = text_buffer[end_idx:]
-                                        should_send = True
-                                        break
-
-                            # Also send if buffer is getting long (100+ chars without punctuation)
-                            if not should_send and len(text_buffer) > 100:
-                                break_point = text_buffer.rfind(' ', 0, 100)
-                                if break_point > 30:
-                                    send_text = text_buffer[:break_point + 1]
-                                    text_buffer = text_buffer[break_point + 1:]
-                                    should_send = True
-
-                            if should_send and send_text.strip():
-                                chunks_sent += 1
-                                logger.info(f"📢 TTS chunk {chunks_sent}: {send_text[:50]}...")
-                                await task.queue_frame(TTSSpeakFrame(text=send_text))
+                        full_response = "".join(full_response_parts)
 
                         # Send any remaining text in buffer
-                        if text_buffer.strip():
+                        if text_buffer and not text_buffer.isspace():
                             chunks_sent += 1
-                            logger.info(f"📢 TTS final chunk {chunks_sent}: {text_buffer[:50]}...")
-                            await task.queue_frame(TTSSpeakFrame(text=text_buffer))
+                            logger.info("📢 TTS final chunk {}: {:.50}...", chunks_sent, text_buffer)
+                            pending_tts.append(asyncio.create_task(task.queue_frame(TTSSpeakFrame(text=text_buffer))))
+
+                        # A failed enqueue takes the Gateway-error path, as an awaited queue_frame did
+                        tts_errors = [r for r in await asyncio.gather(*pending_tts, return_exceptions=True) if isinstance(r, Exception)]
+                        for e in tts_errors:
+                            logger.error("TTS enqueue failed: {}", e)
+                        if tts_errors:
+                            raise tts_errors[0]
+                        bot_stopped_speaking.clear()  # The next stop marks the end of this reply
 
-                        stream_complete_time = time.time()
-                        total_stream_time = stream_complete_time - gateway_send_time
-                        logger.info(f"✅ Streaming complete: {chunks_sent} chunks, {len(full_response)} chars")
-                        logger.info(f"⏱️ [PERF] Stream complete. Total generation: {total_stream_time:.2f}s")
+                        stream_complete_ns = time.monotonic_ns()
+                        logger.info("✅ Streaming complete: {} chunks, {} chars", chunks_sent, len(full_response))
+                        logger.info("⏱️ [PERF] Stream complete. Total generation: {:.2f}s", (stream_complete_ns - gateway_send_ns) / 1e9)
 
                         # If Gateway returned empty, fall back to local LLM
-                        if chunks_sent == 0 or not full_response.strip():
+                        if chunks_sent == 0 or full_response.isspace():
                             logger.warning("⚠️ Gateway returned empty response, falling back to OpenAI LLM")
                             # Don't return - let it fall through to the local LLM
                         else:
                             # Track bot response for echo detection
-                            recent_bot_responses.append(full_response)
-                            if len(recent_bot_responses) > 3:  # Keep last 3 responses
-                                recent_bot_responses.pop(0)
+                            recent_bot_responses.append((full_response, echo_words(full_response)))
 
                             # Set cooldown timer and mark bot as done speaking
-                            # TTS will take ~2-4 more seconds to finish playing
-                            estimated_tts_duration = len(full_response) / 15  # ~15 chars per second
+                            # (cooldown runs until the queued reply should have finished playing)
+                            estimated_tts_duration = estimate_speech_remaining(full_response, first_tts_time)
                             last_bot_speech_end = time.time() + estimated_tts_duration
                             bot_is_speaking = False  # Allow new input after TTS queued
-                            processing_in_progress = False  # Done processing
-                            logger.info(f"🔊 TTS queued, estimated duration: {estimated_tts_duration:.1f}s")
+                            logger.info("🔊 TTS queued, estimated time left: {:.1f}s", estimated_tts_duration)
 
-                            # Post full transcript
-                            try:
-                                await post_transcript(call_id, "assistant", full_response)
-                            except Exception as e:
-                                logger.error(f"Failed to post assistant transcript: {e}")
+                            # Post full transcript (in the background)
+                            queue_transcript(call_id, "assistant", full_response)
 
                             # End call if user said farewell
-                            if is_farewell(user_message):
+                            if farewell:
                                 logger.info("👋 Farewell detected - ending call after response")
-                                # Wait for TTS to finish, then end
-                                await asyncio.sleep(3.0)
+                                # Wait for TTS to finish (bounded by the speech estimate), then end
+                                try:
+                                    await asyncio.wait_for(bot_stopped_speaking.wait(), timeout=estimated_tts_duration + 1.0)
+                                except asyncio.TimeoutError:
+                                    logger.warning("⚠️ No end-of-speech from transport - ending call on estimate")
                                 await task.queue_frame(EndFrame())
 
                             # Don't pass to LLM - we already handled the response
                             return
 
                     except Exception as e:
-                        logger.error(f"Gateway error: {e}")
+                        logger.error("Gateway error: {}", e)
                         first_chunk_received.set()  # Stop filler on error too
                         # Fall through to LLM on Gateway error
                     finally:
-                        # Reset processing flag
-                        processing_in_progress = False
+                        # Done processing
+                        gateway_in_flight.release()
                         bot_is_speaking = False
-                        # Cancel acknowledgment task if still running
+                        # Cancel acknowledgment/filler tasks if still running (no need to wait
+                        # for them to unwind; a cancelled task never reports an unretrieved error)
                         if ack_task and not ack_task.done():
                             ack_task.cancel()
-                            try:
-                                await ack_task
-                            except asyncio.CancelledError:
-                                pass
-                        # Cancel filler task if still running
                         if filler_task and not filler_task.done():
                             filler_task.cancel()
-                            try:
-                                await filler_task
-                            except asyncio.CancelledError:
-                                pass
 
             # Call original push_frame (handle both signatures)
             if direction is not None:
@@ -935,6 +1186,7 @@ When David asks you to do something — check email, look at calendar, update CR
     
     # Run the bot
     runner = PipelineRunner()
+    transcript_worker = asyncio.create_task(_transcript_worker())
     
     @transport.event_handler("on_joined")
     async def on_joined(transport_obj, data):
@@ -952,6 +1204,7 @@ When David asks you to do something — check email, look at calendar, update CR
                 logger.info("✅ Gateway pre-connected")
             except Exception as e:
                 logger.error(f"Gateway pre-connect failed: {e}")
+        gateway_warm.set()
 
         # Wait for transport to be ready
         await asyncio.sleep(1.0)
@@ -988,7 +1241,7 @@ When David asks you to do something — check email, look at calendar, update CR
             logger.info("✅ Greeting queued")
             
             # Post transcript
-            await post_transcript(call_id, "assistant", greeting)
+            queue_transcript(call_id, "assistant", greeting)
         except Exception as e:
             logger.error(f"Failed to queue greeting: {e}", exc_info=True)
     
@@ -1012,24 +1265,32 @@ When David asks you to do something — check email, look at calendar, update CR
             finally:
                 await gateway_client.close()
 
+    interruption_tasks = set()  # Strong refs: the event loop only holds tasks weakly
+
+    async def queue_interruption():
+        try:
+            await task.queue_frame(StartInterruptionFrame())
+        except Exception as e:
+            logger.error(f"Failed to queue interruption frame: {e}")
+
     @transport.event_handler("on_app_message")
     async def on_app_message(transport_obj, message, sender):
         """Handle app messages from the client, including interrupt signals"""
         nonlocal last_bot_speech_end, bot_is_speaking
-        logger.info(f"📨 App message received: {message} from {sender}")
+        # Debug level with deferred formatting: fires for every RTVI client message
+        logger.debug("📨 App message received: {} from {}", message, sender)
 
         # Check for interrupt signal (user-started-speaking from client)
         # Message structure: {'data': {'d': {}, 't': 'user-started-speaking'}, 'type': 'client-message', ...}
+        # Exact-type checks and no {} defaults: this runs for every RTVI message
         msg_type = None
-        if isinstance(message, dict):
-            # Check nested structure first (RTVI client format)
-            data = message.get("data", {})
-            if isinstance(data, dict):
+        if message.__class__ is dict:
+            # Nested structure first (RTVI client format), then top-level type/label
+            data = message.get("data")
+            if data.__class__ is dict:
                 msg_type = data.get("t")
-            # Fall back to top-level type
-            if not msg_type:
-                msg_type = message.get("type") or message.get("label")
-        elif isinstance(message, str):
+            msg_type = msg_type or message.get("type") or message.get("label")
+        elif message.__class__ is str:
             msg_type = message
 
         if msg_type == "user-started-speaking":
@@ -1037,10 +1298,10 @@ When David asks you to do something — check email, look at calendar, update CR
             # Reset cooldown to now so user messages aren't blocked
             last_bot_speech_end = time.time()
             bot_is_speaking = False
-            try:
-                await task.queue_frame(StartInterruptionFrame())
-            except Exception as e:
-                logger.error(f"Failed to queue interruption frame: {e}")
+            # Don't hold the handler on pipeline queue admission; the interruption propagates in parallel
+            interruption = asyncio.create_task(queue_interruption())
+            interruption_tasks.add(interruption)
+            interruption.add_done_callback(interruption_tasks.discard)
 
     try:
         logger.info("🚀 Starting bot...")
@@ -1052,6 +1313,9 @@ When David asks you to do something — check email, look at calendar, update CR
     finally:
         if gateway_client:
             await gateway_client.close()
+        await drain_transcripts()
+        transcript_worker.cancel()
+        await close_transcript_session()
         await runner.cleanup()
     
     logger.info("🛑 Bot stopped.")
@@ -1244,9 +1508,18 @@ You are running in local-only mode without any tool integrations. You can have c
                 ),
             )
 
+            gateway_warm = asyncio.Event()  # Set once the gateway pre-connect attempt has finished
+
             @transport.event_handler("on_client_connected")
             async def on_client_connected(transport_obj, client):
                 logger.info(f"🎉 WebRTC client connected")
+                # Pre-connect gateway in the background so the first turn skips the
+                # handshake (the greeting doesn't wait on it)
+                warm_task = gateway_client.preconnect() if gateway_client else None
+                if warm_task:
+                    warm_task.add_done_callback(lambda _: gateway_warm.set())
+                else:
+                    gateway_warm.set()
                 await asyncio.sleep(0.5)
                 greeting = "Hey David. What can I help you with?"
                 await task.queue_frame(TTSSpeakFrame(text=greeting))
@@ -1272,18 +1545,26 @@ You are running in local-only mode without any tool integrations. You can have c
             # Install gateway interceptor if configured (same as Daily mode)
             if gateway_client:
                 original_push = user_aggregator.push_frame
-                recent_immediate = []
-                recent_fillers = []
-                recent_bot_responses = []
+                immediate_phrases = phrase_cycle(IMMEDIATE_PHRASES)
+                recent_bot_responses = deque(maxlen=3)
                 last_bot_speech_end = 0.0
                 bot_is_speaking = False
                 last_processed_message = ""
-                processing_in_progress = False
+                gateway_in_flight = asyncio.Lock()
+                bot_stopped_speaking = asyncio.Event()
 
                 async def intercept_and_forward(frame, direction=None):
-                    nonlocal recent_immediate, recent_fillers, recent_bot_responses
+                    nonlocal recent_bot_responses
                     nonlocal last_bot_speech_end, bot_is_speaking
-                    nonlocal last_processed_message, processing_in_progress
+                    nonlocal last_processed_message
+
+                    # Upstream from the output transport: the queued speech has finished playing
+                    if isinstance(frame, BotStoppedSpeakingFrame):
+                        bot_stopped_speaking.set()
+
+                    # Re-establish a dropped gateway connection while the user is still talking
+                    if isinstance(frame, UserStartedSpeakingFrame) and not gateway_client.connected:
+                        gateway_client.preconnect()
 
                     if isinstance(frame, LLMMessagesFrame):
                         messages = frame.messages
@@ -1292,100 +1573,102 @@ You are running in local-only mode without any tool integrations. You can have c
 
                             if user_message == last_processed_message:
                                 return
-                            if processing_in_progress:
+                            if gateway_in_flight.locked():
                                 try:
                                     await task.queue_frame(StartInterruptionFrame())
                                 except Exception:
                                     pass
                                 return
-                            if bot_is_speaking and is_echo(user_message, recent_bot_responses, threshold=0.3):
+                            msg_normalized, msg_words = normalize_message(user_message)
+                            if bot_is_speaking and is_echo(user_message, recent_bot_responses, threshold=0.3, user_words=msg_words):
                                 return
 
                             time_since_bot = time.time() - last_bot_speech_end
                             if 0 <= time_since_bot < 0.3:
                                 return
-                            if is_echo(user_message, recent_bot_responses, threshold=0.4):
+                            if is_echo(user_message, recent_bot_responses, threshold=0.4, user_words=msg_words):
                                 return
 
-                            processing_in_progress = True
+                            await gateway_in_flight.acquire()
                             last_processed_message = user_message
-                            simple_chat = is_simple_chat(user_message)
+                            simple_chat = is_simple_chat(user_message, msg_normalized)
+                            farewell = is_farewell(user_message, msg_normalized)
                             first_chunk_received = asyncio.Event()
                             ack_task_inner = None
 
-                            def _pick_phrase(phrase_list, recent_list, max_recent=5):
-                                available = [p for p in phrase_list if p not in recent_list]
-                                if not available:
-                                    recent_list.clear()
-                                    available = phrase_list
-                                phrase = random.choice(available)
-                                recent_list.append(phrase)
-                                if len(recent_list) > max_recent:
-                                    recent_list.pop(0)
-                                return phrase
-
                             async def send_ack():
-                                await asyncio.sleep(2)
+                                await asyncio.sleep(ACK_DELAY_SECS)
                                 if not first_chunk_received.is_set():
-                                    phrase = _pick_phrase(IMMEDIATE_PHRASES, recent_immediate)
+                                    phrase = next(immediate_phrases)
                                     await task.queue_frame(TTSSpeakFrame(text=phrase))
 
                             if not simple_chat:
                                 ack_task_inner = asyncio.create_task(send_ack())
 
                             try:
-                                full_response = ""
+                                if not gateway_warm.is_set():
+                                    try:
+                                        await asyncio.wait_for(gateway_warm.wait(), timeout=0.05)
+                                    except asyncio.TimeoutError:
+                                        logger.warning("⚠️ Gateway not pre-warmed - connecting on first turn")
+
+                                full_response_parts = []  # Joined once the stream ends
                                 text_buffer = ""
+                                scan_from = 0
                                 chunks_sent = 0
+                                first_tts_time = None  # time.monotonic() when the first reply chunk was queued
+                                pending_tts = []  # TTS enqueues in flight; they start in creation order
 
-                                async for chunk in gateway_client.stream_message(user_message):
-                                    full_response += chunk
+                                async for chunk in coalesce(gateway_client.stream_message(user_message)):
+                                    full_response_parts.append(chunk)
                                     text_buffer += chunk
 
                                     if not first_chunk_received.is_set():
                                         first_chunk_received.set()
                                         bot_is_speaking = True
 
-                                    should_send = False
-                                    send_text = ""
-                                    min_chunk = 30 if chunks_sent == 0 else 60
-
-                                    for i, char in enumerate(text_buffer):
-                                        if char in '.!?\n' and i >= min_chunk - 10:
-                                            end_idx = i + 1
-                                            while end_idx < len(text_buffer) and text_buffer[end_idx] in ' \n':
-                                                end_idx += 1
-                                            send_text = text_buffer[:end_idx]
-                                            text_buffer = text_buffer[end_idx:]
-                                            should_send = True
+                                    # WebRTC mode only breaks at sentences (no early clause break);
+                                    # a coalesced batch can hold several, so flush them all
+                                    while True:
+                                        send_text, text_buffer = split_tts_chunk(
+                                            text_buffer, first_chunk=chunks_sent == 0, clause_break=False, scan_from=scan_from
+                                        )
+                                        if not send_text:
+                                            scan_from = len(text_buffer) - 1
                                             break
+                                        scan_from = 0
 
-                                    if not should_send and len(text_buffer) > 100:
-                                        break_point = text_buffer.rfind(' ', 0, 100)
-                                        if break_point > 30:
-                                            send_text = text_buffer[:break_point + 1]
-                                            text_buffer = text_buffer[break_point + 1:]
-                                            should_send = True
+                                        if not send_text.isspace():
+                                            chunks_sent += 1
+                                            if chunks_sent == 1:
+                                                first_tts_time = time.monotonic()
+                                            pending_tts.append(asyncio.create_task(task.queue_frame(TTSSpeakFrame(text=send_text))))
 
-                                    if should_send and send_text.strip():
-                                        chunks_sent += 1
-                                        await task.queue_frame(TTSSpeakFrame(text=send_text))
+                                full_response = "".join(full_response_parts)
 
-                                if text_buffer.strip():
+                                if text_buffer and not text_buffer.isspace():
                                     chunks_sent += 1
-                                    await task.queue_frame(TTSSpeakFrame(text=text_buffer))
-
-                                if chunks_sent > 0 and full_response.strip():
-                                    recent_bot_responses.append(full_response)
-                                    if len(recent_bot_responses) > 3:
-                                        recent_bot_responses.pop(0)
-                                    estimated_tts_duration = len(full_response) / 15
+                                    pending_tts.append(asyncio.create_task(task.queue_frame(TTSSpeakFrame(text=text_buffer))))
+
+                                # A failed enqueue takes the Gateway-error path, as an awaited queue_frame did
+                                tts_errors = [r for r in await asyncio.gather(*pending_tts, return_exceptions=True) if isinstance(r, Exception)]
+                                for e in tts_errors:
+                                    logger.error(f"TTS enqueue failed: {e}")
+                                if tts_errors:
+                                    raise tts_errors[0]
+                                bot_stopped_speaking.clear()  # The next stop marks the end of this reply
+
+                                if chunks_sent > 0 and not full_response.isspace():
+                                    recent_bot_responses.append((full_response, echo_words(full_response)))
+                                    estimated_tts_duration = estimate_speech_remaining(full_response, first_tts_time)
                                     last_bot_speech_end = time.time() + estimated_tts_duration
                                     bot_is_speaking = False
-                                    processing_in_progress = False
 
-                                    if is_farewell(user_message):
-                                        await asyncio.sleep(3.0)
+                                    if farewell:
+                                        try:
+                                            await asyncio.wait_for(bot_stopped_speaking.wait(), timeout=estimated_tts_duration + 1.0)
+                                        except asyncio.TimeoutError:
+                                            pass
                                         await task.queue_frame(EndFrame())
                                     return
 
@@ -1393,7 +1676,7 @@ You are running in local-only mode without any tool integrations. You can have c
                                 logger.error(f"Gateway error: {e}")
                                 first_chunk_received.set()
                             finally:
-                                processing_in_progress = False
+                                gateway_in_flight.release()
                                 bot_is_speaking = False
                                 if ack_task_inner and not ack_task_inner.done():
                                     ack_task_inner.cancel()